@@ -0,0 +1,54 @@
+import os
+import functools
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+
+# Shared transfer settings: objects above the threshold are moved as parallel multipart/ranged requests.
+TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024,
+                                 multipart_chunksize=16 * 1024 * 1024,
+                                 max_concurrency=16,
+                                 max_io_queue=1000,
+                                 io_chunksize=1024 * 1024)
+
+# Transfer settings for downloads that are already fanned out across download_dataset_v2's worker threads. Per-file
+# concurrency is kept low so that workers x max_concurrency stays within the client's connection pool.
+DATASET_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024,
+                                         multipart_chunksize=16 * 1024 * 1024,
+                                         max_concurrency=2,
+                                         max_io_queue=1000,
+                                         io_chunksize=1024 * 1024)
+
+# Transfer settings for standalone downloads of a single, potentially very large object, where fewer but larger
+# ranged requests are fetched in parallel to saturate the connection.
+LARGE_OBJECT_TRANSFER_CONFIG = TransferConfig(multipart_threshold=64 * 1024 * 1024,
+                                              multipart_chunksize=32 * 1024 * 1024,
+                                              max_concurrency=16,
+                                              max_io_queue=1000,
+                                              io_chunksize=1024 * 1024)
+
+
+def get_s3_client():
+    """
+    Returns the S3 client shared across dataio.
+
+    The client is created through boto3's default session, so anything configured with
+    boto3.setup_default_session (profile, region, credentials) applies to it. It is created on first use and reused
+    afterwards, so the botocore service model is only loaded once and connections are pooled across calls. Clients
+    are thread-safe, so it can be used by concurrent downloads.
+
+    A new client is created whenever the default session is replaced (e.g. by calling boto3.setup_default_session
+    again) and in each forked process.
+    """
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    return _cached_s3_client(os.getpid(), boto3.DEFAULT_SESSION)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_s3_client(pid, default_session):
+    """Creates the S3 client for a process and default session. Arguments only serve as the cache key."""
+    return boto3.client('s3', config=Config(max_pool_connections=32,
+                                            retries={'mode': 'adaptive', 'max_attempts': 10},
+                                            tcp_keepalive=True))
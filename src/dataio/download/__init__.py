@@ -1,16 +1,86 @@
 import os
+import gzip
+import shutil
+import json
+import hashlib
+import functools
 import warnings
-import boto3
-from tempfile import NamedTemporaryFile
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import mkstemp
+import httpx
 import yaml
+from importlib.resources import files
 from typing import Tuple, Dict, Optional, Union
-import pkg_resources
 import platform
+from pathlib import Path
+from dataio._s3 import DATASET_TRANSFER_CONFIG, LARGE_OBJECT_TRANSFER_CONFIG, get_s3_client
+
+
+# Use the libyaml C loader where available, falling back to the pure Python loader
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+# Settings shipped with the package, loaded once on import
+_SETTINGS = yaml.load(files(__package__).joinpath('settings.yaml').read_text(), Loader=_YAMLLoader)
+
+# Directory used to persist documentation fetched from GitHub between runs
+_GH_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dataio")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_gh_client() -> httpx.Client:
+    """
+    Returns the client shared by all GitHub requests, so that connections are kept alive and reused.
+
+    The client is created on first use, so importing dataio doesn't pay for setting it up. Over HTTP/2, concurrent
+    requests are multiplexed on a single connection. HTTP/2 needs the optional h2 package; without it the client
+    falls back to HTTP/1.1.
+    """
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.Client(http2=http2, timeout=30.0, follow_redirects=True,
+                        limits=httpx.Limits(max_keepalive_connections=10))
+
+
+def _gunzip_if_encoded(client, bucket: str, key: str, path: str) -> None:
+    """
+    Decompresses a downloaded file in place if it is stored on S3 with gzip content encoding.
+
+    The object's metadata is only requested if the file starts with the gzip magic number. If the encoding cannot be
+    checked or the file cannot be decompressed, the downloaded file is removed, so that a still-compressed file is not
+    left behind, and the error is re-raised.
+    """
+    with open(path, 'rb') as f:
+        if f.read(2) != b'\x1f\x8b':
+            return
+
+    try:
+        if client.head_object(Bucket=bucket, Key=key).get('ContentEncoding') != 'gzip':
+            return
+
+        fd, tmp_path = mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as dst, gzip.open(path, 'rb') as src:
+                shutil.copyfileobj(src, dst)
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except BaseException:
+        os.remove(path)
+        raise
 
 
 def download_file_from_URI(URI: str, path: str = None, temp: bool = False):
-    """Downloads a file from a URI.
+    """Downloads a file from a URI. Files stored with gzip content encoding (see upload_file_to_URI)
+    are decompressed after download.
 
     Parameters:
         URI (str): The URI from which to download the file.
@@ -29,15 +99,15 @@ def download_file_from_URI(URI: str, path: str = None, temp: bool = False):
     if not URI.startswith("s3://"):
         raise ValueError("Invalid URI. URI should start with 's3://'.")
 
-    # Find the index of the first "/" after "s3://"
-    first_slash_index = URI.find("/", 5)
+    # Split the URI once into its bucket and key
+    bucket, slash, key = URI[len("s3://"):].partition("/")
 
     # Check if there are characters between "s3://" and the next "/"
-    if first_slash_index == -1 or first_slash_index == 5:
+    if not bucket or not slash:
         raise ValueError("Invalid URI. URI should contain characters between 's3://' and the subsequent '/'.")
 
-    # Check if there are characters after the third "/"
-    if first_slash_index == len(URI) - 1:
+    # Check if there are characters after the subsequent "/"
+    if not key:
         raise ValueError("Invalid URI. URI should contain characters after the subsequent '/'.")
 
     if path is None:
@@ -50,33 +120,182 @@ def download_file_from_URI(URI: str, path: str = None, temp: bool = False):
         if not os.path.exists(path):
             raise ValueError("The provided path does not exist.")
 
-    # Infer file extension from URI
-    parts = URI.split('.')
-    if len(parts) < 2 or not parts[-1]:
+    # Infer filename and file extension from URI
+    filename = key.rsplit("/", 1)[-1]
+    _, dot, ext = filename.rpartition('.')
+    if not dot or not ext:
         raise ValueError("No extension found in the URI.")
-    ext = parts[-1]
 
     # If path is provided and temp is False, append filename to path
     if path is not None:
-        filename = URI.split("/")[-1]
         path = os.path.join(path, filename)
 
     # Create a named temporary file if needed
-    if path is None and temp:
-        with NamedTemporaryFile(suffix='.' + ext, delete=False) as temp_file:
-            path = temp_file.name
+    created_temp_file = path is None and temp
+    if created_temp_file:
+        fd, path = mkstemp(suffix='.' + ext)
+        os.close(fd)
 
-    client = boto3.client('s3')
-    bucket = URI.split("/")[2]
-    key = '/'.join(URI.split("/")[3:])
+    client = get_s3_client()
 
     try:
-        client.download_file(Bucket=bucket, Key=key, Filename=path)
+        client.download_file(Bucket=bucket, Key=key, Filename=path, Config=LARGE_OBJECT_TRANSFER_CONFIG)
+        # Transparently decompress files that were uploaded with compression
+        _gunzip_if_encoded(client, bucket, key, path)
         return path, True, None
     except Exception as e:
+        # Don't leave an orphaned temporary file behind
+        if created_temp_file and os.path.exists(path):
+            os.remove(path)
         return None, False, e
 
 
+def _write_gh_cache(path: str, content: bytes) -> None:
+    """Atomically writes content to the GitHub cache on disk. The cache is best-effort, so failures are ignored."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=32)
+def _fetch_gh_tree(api_base_url: str, owner: str, repo: str, branch: str) -> Dict[str, str]:
+    """
+    Fetches the recursive file tree of a branch of a GitHub repository, returning a mapping of the path of every
+    file (blob) in the tree to its SHA.
+
+    The tree is cached on disk along with its ETag, so that it is only re-downloaded if it has changed on GitHub,
+    and memoised in-process, so that repeated calls within a session do not hit the network at all.
+
+    Raises:
+        ValueError: If the tree could not be fetched.
+    """
+    tree_url = f"{api_base_url}{owner}/{repo}/git/trees/{branch}?recursive=1"
+    # Include a short hash of the API base URL, so that trees from different hosts don't share a cache file
+    api_hash = hashlib.sha1(api_base_url.encode('utf-8')).hexdigest()[:8]
+    cache_path = os.path.join(_GH_CACHE_DIR, f"gh_tree_{api_hash}_{owner}_{repo}_{branch}.json".replace("/", "_"))
+
+    # Make a conditional request if a cached copy of the tree exists
+    headers = {}
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = None
+    else:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    # Make request to GitHub tree API endpoint
+    response = _get_gh_client().get(tree_url, headers=headers)
+
+    # Check status code of the response
+    if response.status_code == 304 and cached is not None:
+        tree = cached['tree']
+    elif response.status_code == 200:
+        tree = response.json().get('tree', [])
+    elif response.status_code == 404:
+        raise ValueError("Resource not found. Please check if the repository or branch exists.")
+    elif response.status_code == 422:
+        raise ValueError("Validation failed or the endpoint has been spammed.")
+    else:
+        raise ValueError("Unknown error occurred while fetching tree data from GitHub.")
+
+    if response.status_code == 200:
+        _write_gh_cache(cache_path, json.dumps({'etag': response.headers.get('ETag'),
+                                                'last_modified': response.headers.get('Last-Modified'),
+                                                'tree': tree}).encode('utf-8'))
+
+    return {file_info['path']: file_info.get('sha') for file_info in tree if file_info.get('type') == 'blob'}
+
+
+def _git_blob_sha(content: bytes) -> str:
+    """Computes the SHA git assigns to a blob with the given content."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def _fetch_gh_raw(url: str, sha: Optional[str]) -> Tuple[int, bytes]:
+    """
+    Fetches the raw content of a file on GitHub, returning the status code and content of the response.
+
+    Files are cached on disk by their blob SHA, so a file that has not changed is never downloaded twice. Content is
+    only cached, and cached content only used, if it hashes to that SHA, since the file is fetched from the branch
+    head, which may have moved on since the tree was fetched.
+    """
+    cache_path = os.path.join(_GH_CACHE_DIR, "blobs", sha) if sha else None
+    if cache_path is not None and os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            content = f.read()
+        if _git_blob_sha(content) == sha:
+            return 200, content
+
+    response = _get_gh_client().get(url)
+    if response.status_code == 200 and cache_path is not None and _git_blob_sha(response.content) == sha:
+        _write_gh_cache(cache_path, response.content)
+    return response.status_code, response.content
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_docs_cached(dsid: str, owner: str, repo: str, branch: str, catalogue_path: str,
+                       datadict_fname: str, metadata_fname: str,
+                       api_base_url: str, raw_base_url: str) -> Tuple[bytes, bytes]:
+    """
+    Fetches the raw content of the metadata and data dictionary for a dataset ID from a GitHub repository.
+
+    Results are memoised in-process, so repeated requests for the same dataset do not hit the network.
+
+    Raises:
+        ValueError: If metadata or data dictionary files are not found for the specified dataset ID.
+    """
+    # Fetch the files in the repository
+    tree_blobs = _fetch_gh_tree(api_base_url, owner, repo, branch)
+
+    # Construct path prefix based on dataset ID
+    dsid_path_prefix = f"{catalogue_path}/{dsid[0:2]}/{dsid}-"
+
+    # Find data dictionary file in the tree
+    gh_datadict_path = next((path for path in tree_blobs
+                             if path.startswith(dsid_path_prefix) and path.endswith(datadict_fname)), None)
+
+    # Raise error if data dictionary file not found
+    if not gh_datadict_path:
+        raise ValueError(f"Data dictionary file not found for dataset ID '{dsid}'.")
+
+    # Construct path for the metadata file, which sits alongside the data dictionary
+    gh_metadata_path = gh_datadict_path[:-len(datadict_fname)] + metadata_fname
+    gh_datadict_sha = tree_blobs[gh_datadict_path]
+    gh_metadata_sha = tree_blobs.get(gh_metadata_path)
+
+    # Construct URLs to fetch raw content of metadata and data dictionary files
+    gh_raw_metadata_url = f"{raw_base_url}{owner}/{repo}/{branch}/{gh_metadata_path}"
+    gh_raw_datadict_url = f"{raw_base_url}{owner}/{repo}/{branch}/{gh_datadict_path}"
+
+    # Retrieve metadata and data dictionary concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        metadata_future = executor.submit(_fetch_gh_raw, gh_raw_metadata_url, gh_metadata_sha)
+        datadict_future = executor.submit(_fetch_gh_raw, gh_raw_datadict_url, gh_datadict_sha)
+        metadata_status, metadata_content = metadata_future.result()
+        datadict_status, datadict_content = datadict_future.result()
+
+    if metadata_status == 404:
+        raise ValueError(f"Metadata file not found for dataset ID '{dsid}'.")
+    elif metadata_status != 200:
+        raise ValueError(f"Failed to retrieve metadata for dataset ID '{dsid}'. Request failed.")
+
+    if datadict_status == 404:
+        raise ValueError(f"Data dictionary file not found for dataset ID '{dsid}'.")
+    elif datadict_status != 200:
+        raise ValueError(f"Failed to retrieve data dictionary for dataset ID '{dsid}'. Request failed.")
+
+    return metadata_content, datadict_content
+
+
 def fetch_data_documentation(*, dsid: str,
                              gh_urls: Optional[Dict[str, str]] = None,
                              repo_info: Optional[Dict[str, str]] = None,
@@ -98,6 +317,7 @@ def fetch_data_documentation(*, dsid: str,
     Raises:
         ValueError: If metadata or data dictionary files are not found for the specified dataset ID.
         TypeError: If dsid is not a string.
+        httpx.HTTPError: If a request to GitHub fails, e.g. on a connection error or timeout.
     """
 
     # Validate repo_info dictionary
@@ -149,62 +369,16 @@ def fetch_data_documentation(*, dsid: str,
     datadict_fname = repo_info.get('datadict_fname', "datadictionary.yaml")
     metadata_fname = repo_info.get('metadata_fname', "metadata.yaml")
 
-    # Construct URL to fetch the tree of files
-    tree_url = f"{gh_api_base_url}{owner}/{repo}/git/trees/{branch}?recursive=1"
-
-    # Make request to GitHub tree API endpoint
-    response = requests.get(tree_url)
-
-    # Check status code of the response
-    if response.status_code == 200:
-        tree = response.json().get('tree', [])
-    elif response.status_code == 404:
-        raise ValueError("Resource not found. Please check if the repository or branch exists.")
-    elif response.status_code == 422:
-        raise ValueError("Validation failed or the endpoint has been spammed.")
-    else:
-        raise ValueError("Unknown error occurred while fetching tree data from GitHub.")
-
-    # Construct path prefix based on dataset ID
-    dsid_path_prefix = f"{catalogue_path}/{dsid[0:2]}/{dsid}-"
-
-    # Find data dictionary file in the tree
-    gh_datadict_path = None
-    for file_info in tree:
-        if file_info['path'].startswith(dsid_path_prefix) and file_info['path'].endswith(datadict_fname):
-            gh_datadict_path = file_info['path']
-            break
-
-    # Raise error if data dictionary file not found
-    if not gh_datadict_path:
-        raise ValueError(f"Data dictionary file not found for dataset ID '{dsid}'.")
-
-    # Construct paths for metadata files
-    gh_metadata_path = gh_datadict_path.replace(datadict_fname, metadata_fname)
-
-    # Construct URLs to fetch raw content of metadata and data dictionary files
-    gh_raw_metadata_url = f"{gh_raw_base_url}{owner}/{repo}/{branch}/{gh_metadata_path}"
-    gh_raw_datadict_url = f"{gh_raw_base_url}{owner}/{repo}/{branch}/{gh_datadict_path}"
-
-    # Retrieve and parse metadata
-    raw_metadata_response = requests.get(gh_raw_metadata_url)
-    if raw_metadata_response.status_code == 404:
-        raise ValueError(f"Metadata file not found for dataset ID '{dsid}'.")
-    elif raw_metadata_response.status_code != 200:
-        raise ValueError(f"Failed to retrieve metadata for dataset ID '{dsid}'. Request failed.")
-
-    # Retrieve and parse data dictionary
-    raw_datadict_response = requests.get(gh_raw_datadict_url)
-    if raw_datadict_response.status_code == 404:
-        raise ValueError(f"Data dictionary file not found for dataset ID '{dsid}'.")
-    elif raw_datadict_response.status_code != 200:
-        raise ValueError(f"Failed to retrieve data dictionary for dataset ID '{dsid}'. Request failed.")
+    # Retrieve raw content of metadata and data dictionary files
+    metadata_content, datadict_content = _fetch_docs_cached(dsid, owner, repo, branch, catalogue_path,
+                                                            datadict_fname, metadata_fname,
+                                                            gh_api_base_url, gh_raw_base_url)
 
     if binary:
-        return raw_metadata_response.content, raw_datadict_response.content
+        return metadata_content, datadict_content
     else:
-        metadata = yaml.safe_load(raw_metadata_response.content.decode('utf-8'))
-        datadict = yaml.safe_load(raw_datadict_response.content.decode('utf-8'))
+        metadata = yaml.load(metadata_content.decode('utf-8'), Loader=_YAMLLoader)
+        datadict = yaml.load(datadict_content.decode('utf-8'), Loader=_YAMLLoader)
 
         return metadata, datadict
 
@@ -243,13 +417,13 @@ def download_dataset_v2(*,
     Raises:
         ValueError: If no files meet the specified criteria or if the dataset is not found in the S3 bucket.
         TypeError: If dsid or data_state is not a string.
+        RuntimeError: If one or more files fail to download. All other files are still attempted.
 
     Returns:
         None
     """
 
-    with open(pkg_resources.resource_filename(__name__, 'settings.yaml'), 'r') as f:
-        settings = yaml.safe_load(f)
+    settings = _SETTINGS
 
     if not isinstance(dsid, str):
         raise TypeError("dsid must be a string.")
@@ -260,96 +434,60 @@ def download_dataset_v2(*,
     if Bucket is None:
         raise ValueError(f"{data_state} is not a valid data state. Must be one of {str(settings['data_state_buckets'].keys())}")
 
-    # Initialize the S3 client
-    client = boto3.client('s3')
+    # Get the S3 client, shared by all download threads
+    client = get_s3_client()
     listobjv2_paginator = client.get_paginator('list_objects_v2')
 
-    # Get the common prefixes (folders) from the bucket
-    dsid_names = {}
-    for prefix in listobjv2_paginator.paginate(Bucket=Bucket, Delimiter='/').search('CommonPrefixes'):
-        folder = prefix.get('Prefix')
-        dsid_names[folder.split("-")[0]] = folder
-
-    # Determine the prefix for the specified dsid
-    dsid_name = dsid_names.get(dsid)
-    if dsid_name is None:
+    # Determine the prefix (folder) for the specified dsid by listing only the folders that start with it
+    page = client.list_objects_v2(Bucket=Bucket, Prefix=f"{dsid}-", Delimiter='/')
+    # As before, if several folders match, the last one in listing order is used
+    dsid_folders = [prefix['Prefix'] for prefix in page.get('CommonPrefixes', [])]
+    if not dsid_folders:
         raise ValueError(f"Dataset {dsid} not found in specified state {data_state} on Bucket.")
+    dsid_name = dsid_folders[-1]
 
     # List objects in the dsid prefix
     listobjv2_files = listobjv2_paginator.paginate(Bucket=Bucket, Prefix=dsid_name)
 
-    # Collect files found by iterating through all tranches
+    # Collect files found, and their last modified times on S3, by iterating through all tranches
     files_found = []
+    s3_mtime = {}
     for tranch in listobjv2_files:
         files_found += [item['Key'] for item in tranch['Contents'] if not item['Key'].endswith("/")]
-
-    # Filter files based on contains_any criteria and build the dictionary
-    if contains_any is not None:
-        if isinstance(contains_any, str):
-            contains_any = [contains_any]
-        elif not isinstance(contains_any, list):
-            raise TypeError("contains_any must be a string, list, or None.")
-
-        # Initialize dictionary to store files containing each item from contains_any
-        files_containing_any = set()
-        firstLoop = True
-        for item in contains_any:
-            files_containing_this_item = [file for file in files_found if item in file]
-            if firstLoop:
-                files_containing_any = set(files_containing_this_item)
-            else:
-                if files_containing_any.isdisjoint(files_containing_this_item):
-                    files_containing_any.update(files_containing_this_item)
-                else:
-                    repeats = set.intersection(files_containing_any, files_containing_this_item)
-                    raise ValueError(f"A file cannot contain more than one item from the contains_any list: {repeats}")
-    else:
-        files_containing_any = set(files_found)
-
-    # Filter files based on contains_all criteria
-    if contains_all is not None:
-        if isinstance(contains_all, str):
-            contains_all = [contains_all]
-        elif not isinstance(contains_all, list):
-            raise TypeError("contains_all must be a string, list, or None.")
-
-        # Initialising set to store files containing all items from contains_all
-        files_containing_all = set()
-        firstLoop = True
-        for item in contains_all:
-            files_containing_this_item = set([file for file in files_found if item in file])
-            # Set needs to be initialised if
-            if firstLoop:
-                files_containing_all = files_containing_this_item
-                firstLoop = False
-            else:
-                files_containing_all = files_containing_all.intersection(files_containing_this_item)
-    else:
-        files_containing_all = set(files_found)
-
-    # Filter files based on suffixes criteria
-    if suffixes is not None:
-        if isinstance(suffixes, str):
-            suffixes = [suffixes]
-        elif not isinstance(suffixes, list):
-            raise TypeError("suffixes must be a string, list, or None.")
-
-        files_with_suffixes = set()
-        first_loop = True
-        for suffix in suffixes:
-            files_with_this_suffix = set([file for file in files_found if file.endswith(suffix)])
-            if first_loop:
-                files_with_suffixes = files_with_this_suffix
-                first_loop = False
-            else:
-                files_with_suffixes = files_with_suffixes.intersection(files_with_this_suffix)
+        s3_mtime.update({item['Key']: item['LastModified'].timestamp() for item in tranch['Contents']})
+
+    # Normalise the filter criteria to tuples
+    if isinstance(contains_any, str):
+        contains_any = (contains_any,)
+    elif isinstance(contains_any, list):
+        contains_any = tuple(contains_any)
+    elif contains_any is not None:
+        raise TypeError("contains_any must be a string, list, or None.")
+
+    if isinstance(contains_all, str):
+        contains_all = (contains_all,)
+    elif isinstance(contains_all, list):
+        contains_all = tuple(contains_all)
+    elif contains_all is not None:
+        raise TypeError("contains_all must be a string, list, or None.")
+
+    if isinstance(suffixes, str):
+        suffixes = (suffixes,)
+    elif isinstance(suffixes, list):
+        suffixes = tuple(suffixes)
+    elif suffixes is not None:
+        raise TypeError("suffixes must be a string, list, or None.")
+
+    # Filter files on contains_any, contains_all and suffixes criteria in a single pass, unless there are none
+    if contains_any is None and contains_all is None and suffixes is None:
+        files_to_download = set(files_found)
     else:
-        files_with_suffixes = set(files_found)
-
-    # Get the intersection of files_containing_any, files_containing_all, and files_with_suffixes
-    files_to_download = files_containing_any.intersection(files_containing_all, files_with_suffixes)
+        files_to_download = {file for file in files_found
+                             if (contains_any is None or any(item in file for item in contains_any))
+                             and (contains_all is None or all(item in file for item in contains_all))
+                             and (suffixes is None or file.endswith(suffixes))}
 
-    # Check if the intersection is empty
+    # Check if any files are left after filtering
     if not files_to_download:
         raise ValueError("No files meet specified criteria.")
 
@@ -357,87 +495,96 @@ def download_dataset_v2(*,
     if not isinstance(datadir, str):
         raise ValueError(f"{datadir} is not a string.")
 
-    # Download all files
-    for file_path in files_to_download:
-        # Construct the full destination path
-        destination_path = os.path.join(datadir, file_path)
-
-        if platform.system() != 'Windows' and update:
-            warnings.warn("Due to limitations in UNIX systems, update will not check to ensure that you've not" +
-                          f"changed files locally. Prune local dir '{datadir}'" +
-                          "if you have made changes, or set 'update' to False.", Warning)
-
-        # Check if the file exists locally and if update is enabled
-        if update and os.path.exists(destination_path):
-            # Get the last modified time of the local file
-            local_last_modified_time = os.path.getmtime(destination_path)
-
-            # Get the creation time of the local file
-            local_creation_time = os.path.getctime(destination_path)
-
-            # Get the last modified time of the file on S3
-            response = client.head_object(Bucket=Bucket, Key=file_path)
-            s3_last_modified_time = response['LastModified'].timestamp()
+    if platform.system() != 'Windows' and update:
+        warnings.warn("Due to limitations in UNIX systems, update will not check to ensure that you've not" +
+                      f"changed files locally. Prune local dir '{datadir}'" +
+                      "if you have made changes, or set 'update' to False.", Warning)
+
+    # Create the directory structure up front, once per unique directory
+    for directory in {os.path.dirname(os.path.join(datadir, file_path)) for file_path in files_to_download}:
+        os.makedirs(directory, exist_ok=True)
+
+    def _fetch_file(file_path, destination_path):
+        """Downloads a file from S3, decompressing it if it was uploaded with compression."""
+        client.download_file(Bucket=Bucket, Key=file_path, Filename=destination_path, Config=DATASET_TRANSFER_CONFIG)
+        _gunzip_if_encoded(client, Bucket, file_path, destination_path)
+
+    def _download_one(file_path):
+        """Downloads a single file, returning the file path and the exception raised, if any."""
+        try:
+            # Construct the full destination path
+            destination_path = os.path.join(datadir, file_path)
+
+            # Check if the file exists locally and if update is enabled
+            if update and os.path.exists(destination_path):
+                # Get the last modified and creation times of the local file with a single stat call
+                local_stat = os.stat(destination_path)
+                local_last_modified_time = local_stat.st_mtime
+                local_creation_time = local_stat.st_ctime
+
+                # Get the last modified time of the file on S3
+                s3_last_modified_time = s3_mtime[file_path]
+
+                # Compare the last modified time with the creation time
+                if local_last_modified_time > local_creation_time:
+                    # Attempt to update the file from S3 if it has been modified locally
+                    _fetch_file(file_path, destination_path)
+                    if verbose:
+                        print(f"Local file '{destination_path}' has been modified since last download. Redownloading...")
 
-            # Compare the last modified time with the creation time
-            if local_last_modified_time > local_creation_time:
-                # Attempt to update the file from S3 if it has been modified locally
-                client.download_file(Bucket=Bucket, Key=file_path, Filename=destination_path)
+                elif s3_last_modified_time > local_creation_time:
+                    # Download the file from S3 if it has been updated since download
+                    _fetch_file(file_path, destination_path)
+                    if verbose:
+                        print(f"File '{file_path}' has been updated on S3. Redownloading...")
+                elif verbose:
+                    print(f"File '{file_path}' is up to date with S3. Ignoring...")
+            else:
+                # Download the file from S3
+                _fetch_file(file_path, destination_path)
                 if verbose:
-                    print(f"Local file '{destination_path}' has been modified since last download. Redownloading...")
+                    print(f"File '{file_path}' has been downloaded from S3.")
+        except Exception as e:
+            return file_path, e
+        return file_path, None
 
-            elif s3_last_modified_time > local_creation_time:
-                # Download the file from S3 if it has been updated since download
-                client.download_file(Bucket=Bucket, Key=file_path, Filename=destination_path)
-                if verbose:
-                    print(f"File '{file_path}' has been updated on S3. Redownloading...")
-            elif verbose:
-                print(f"File '{file_path}' is up to date with S3. Ignoring...")
-        else:
-            # Create the directory structure if it doesn't exist
-            directory = os.path.dirname(destination_path)
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-            # Download the file from S3
-            client.download_file(Bucket=Bucket, Key=file_path, Filename=destination_path)
-            if verbose:
-                print(f"File '{file_path}' has been downloaded from S3.")
+    # Download all files concurrently, collecting failures instead of stopping at the first one. 16 workers with
+    # DATASET_TRANSFER_CONFIG's per-file concurrency of 2 fill, but do not exceed, the S3 client's 32 connections.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(_download_one, files_to_download))
+
+    failed_downloads = {file_path: e for file_path, e in results if e is not None}
+    if failed_downloads:
+        raise RuntimeError(f"Failed to download {len(failed_downloads)} file(s) from S3: {sorted(failed_downloads)}") \
+            from next(iter(failed_downloads.values()))
 
     # Prune the folder to remove extraneous elements
     if clean:
-        exception_fnames = ["datadictionary.yaml", "metadata.yaml"]
-        for i in range(len(exception_fnames)):
-            exception_fnames[i] = os.path.join(dsid_name, exception_fnames[i])
-        print(exception_fnames)
-        datadir_prefix_length = len(os.path.join(datadir)) + 1
-        for root, dirs, files in os.walk(os.path.join(datadir, dsid_name)):
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_path_relative = file_path[datadir_prefix_length:]
-                if file_path_relative not in files_found and file_path_relative not in exception_fnames:
-                    if verbose:
-                        warnings.warn(f"Deleting extraneous file: {file_path}")
-                    os.remove(file_path)
+        exception_fnames = {os.path.join(dsid_name, fname) for fname in ("datadictionary.yaml", "metadata.yaml")}
+        local_files = {path.relative_to(datadir).as_posix()
+                       for path in Path(datadir, dsid_name).rglob('*') if path.is_file()}
+        for file_path_relative in local_files - set(files_found) - exception_fnames:
+            file_path = os.path.join(datadir, file_path_relative)
+            if verbose:
+                warnings.warn(f"Deleting extraneous file: {file_path}")
+            os.remove(file_path)
 
     # If Requested, fetch all relevant documentation
     if fetch_docs:
         metadata, datadict = fetch_data_documentation(dsid=dsid, default=True, binary=True)
 
-        if metadata is not None:
-            metadata_file_path = os.path.join(datadir, dsid_name, "metadata.yaml")
-
-            # Ensure that the directory exists
-            os.makedirs(os.path.dirname(metadata_file_path), exist_ok=True)
-
-            # Dump the dictionary to the metadata YAML file
-            with open(metadata_file_path, 'wb') as file:
-                file.write(metadata)
-        if datadict is not None:
-            datadict_file_path = os.path.join(datadir, dsid_name, "datadictionary.yaml")
-
-            # Ensure that the directory exists
-            os.makedirs(os.path.dirname(datadict_file_path), exist_ok=True)
-
-            # Dump the dictionary to the metadata YAML file
-            with open(datadict_file_path, 'wb') as file:
-                file.write(datadict)
+        # Ensure that the directory exists
+        target_dir = os.path.join(datadir, dsid_name)
+        os.makedirs(target_dir, exist_ok=True)
+
+        def _write_doc(fname, content):
+            with open(os.path.join(target_dir, fname), 'wb') as file:
+                file.write(content)
+
+        # Dump the metadata and data dictionary to their YAML files concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(_write_doc, fname, content)
+                       for fname, content in (("metadata.yaml", metadata), ("datadictionary.yaml", datadict))
+                       if content is not None]
+            for future in futures:
+                future.result()
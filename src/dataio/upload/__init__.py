@@ -1,15 +1,39 @@
-import boto3
+import gzip
+import shutil
+from tempfile import SpooledTemporaryFile
+from dataio._s3 import TRANSFER_CONFIG, get_s3_client
 
 
-def upload_file_to_URI(URI, file):
+def upload_file_to_URI(URI, file, compress=False):
+    """Uploads a file to a URI.
 
-    client = boto3.client('s3')
+    Parameters:
+        URI (str): The URI to upload the file to.
+        file (file object): The file to upload.
+        compress (bool, optional): If True, the file is gzipped before upload and stored with gzip content encoding,
+            so that download_file_from_URI transparently decompresses it. Default is False.
+    """
 
-    URI = URI.removeprefix("s3://")
-    Bucket = URI.split("/")[0]
-    Key = URI.removeprefix(Bucket + "/")
+    client = get_s3_client()
 
-    client.upload_file(Filename=file.name,
-                       Bucket=Bucket,
-                       Key=Key
-                       )
+    Bucket, _, Key = URI.removeprefix("s3://").partition("/")
+
+    if compress:
+        # Compress into memory, spilling over to disk for large files
+        with open(file.name, 'rb') as src, SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buffer:
+            with gzip.GzipFile(fileobj=buffer, mode='wb') as gz:
+                shutil.copyfileobj(src, gz)
+            buffer.seek(0)
+
+            client.upload_fileobj(buffer,
+                                  Bucket=Bucket,
+                                  Key=Key,
+                                  ExtraArgs={'ContentEncoding': 'gzip'},
+                                  Config=TRANSFER_CONFIG
+                                  )
+    else:
+        client.upload_file(Filename=file.name,
+                           Bucket=Bucket,
+                           Key=Key,
+                           Config=TRANSFER_CONFIG
+                           )